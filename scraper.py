@@ -12,23 +12,281 @@ Notes:
 - Use responsibly and follow each site's robots.txt and terms of service.
 """
 import argparse
-import json
+import asyncio
+import hashlib
+import html
+import random
+import re
 import sys
 import time
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Match, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+try:
+    import lxml  # noqa: F401  (C-backed parser, much faster than html.parser)
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+try:
+    import brotli  # noqa: F401  (lets httpx decode br-compressed responses)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Desktop browser User-Agents; each request picks one at random.
+UA_POOL = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14.4; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:124.0) Gecko/20100101 Firefox/124.0",
+]
 
 HEADERS = {
-    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0 Safari/537.36"
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0 Safari/537.36",
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
 
+# Review pages requested concurrently per source before checking for the last page.
+PAGE_BATCH = 4
+REQUEST_TIMEOUT = httpx.Timeout(20)
+# Threads that parse pages so the event loop stays free to drive downloads.
+# bs4 feeds lxml through Python callbacks for every element, so the GIL is
+# held while parsing and pages are not parsed in parallel.
+PARSE_POOL = ThreadPoolExecutor(max_workers=4)
+# Connection pool shared by every scraper, and the retry policy for transient errors.
+POOL_SIZE = 20
+KEEPALIVE_CONNECTIONS = 10
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+# Longest Retry-After (seconds) honoured on a 429/503 before giving up on the page.
+MAX_RETRY_AFTER = 60
+# Delay between requests to the same host: a fixed threshold per host plus
+# a random increment of up to DELAY_JITTER seconds.
+HOST_DELAY = {"g2.com": 1.0, "capterra.com": 1.0, "trustradius.com": 1.0}
+DEFAULT_HOST_DELAY = 1.0
+DELAY_JITTER = 1.5
+# On-disk caches for search-page -> product-URL lookups and for review
+# pages, which are revalidated with ETag / Last-Modified on later runs.
+CACHE_DIR = Path.home() / ".cache" / "pulse"
+RESOLVE_CACHE_TTL = 24 * 60 * 60
+# Cached review pages expire after a week; only the most recent runs are kept.
+PAGE_CACHE_TTL = 7 * 24 * 60 * 60
+PAGE_CACHE_MAX_RUNS = 20
+
+# Restrict parsing to review cards; the fallback strainers are used only
+# when the primary markup is missing from a page.
+# Any class containing "review", as the CSS selector div[class*='review'] did.
+G2_FALLBACK_CLASS_RE = re.compile("review")
+G2_REVIEW_STRAINER = SoupStrainer("div", attrs={"itemprop": "review"})
+G2_FALLBACK_STRAINER = SoupStrainer("div", attrs={"class": G2_FALLBACK_CLASS_RE})
+CAPTERRA_REVIEW_STRAINER = SoupStrainer("div", attrs={"class": "c-review"})
+CAPTERRA_FALLBACK_STRAINER = SoupStrainer(["div","li"], attrs={"class": "review"})
+TRUSTRADIUS_REVIEW_STRAINER = SoupStrainer(["div","article"], attrs={"class": ["review-card","review"]})
+
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_DMY_DATE_RE = re.compile(r"^\d{1,2}-\d{1,2}-\d{4}$")
+DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%d %B %Y", "%B %d, %Y", "%b %d, %Y")
+
+@dataclass
+class Review:
+    """One scraped review; serialized to JSON field-for-field by orjson."""
+    __slots__ = ("title", "review", "date", "rating", "reviewer", "source")
+    title: str
+    review: str
+    date: str
+    rating: str
+    reviewer: str
+    source: str
+
+class AsyncRateLimiter:
+    """
+    Per-host politeness delay. Requests to one host are spaced by its delay
+    plus a random jitter, while requests to different hosts proceed concurrently.
+    """
+    def __init__(self, delays: Dict[str, float], default_delay: float, jitter: float = 0.0):
+        self.delays = delays
+        self.default_delay = default_delay
+        self.jitter = jitter
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last: Dict[str, float] = {}
+        self._resume: Dict[str, float] = {}
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Hold back every request to host for at least seconds (e.g. a Retry-After)."""
+        self._resume[host] = max(self._resume.get(host, 0.0), time.monotonic() + seconds)
+
+    @asynccontextmanager
+    async def acquire(self, host: str):
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self.delays.get(host, self.default_delay) + random.uniform(0, self.jitter)
+            while True:
+                # re-check after sleeping, in case defer() pushed the host back meanwhile
+                now = time.monotonic()
+                wait = max(delay - (now - self._last.get(host, float("-inf"))),
+                           self._resume.get(host, 0.0) - now)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            self._last[host] = time.monotonic()
+        yield
+
+@dataclass
+class HttpContext:
+    """
+    HTTP state shared by the scrapers during one run. The limiter's locks and
+    the robots.txt futures are bound to the running event loop, so each run
+    makes its own.
+    """
+    session: httpx.AsyncClient
+    limiter: AsyncRateLimiter
+    robots: Dict[str, "asyncio.Future[RobotFileParser]"] = field(default_factory=dict)
+
+def _host(url: str) -> str:
+    host = urlsplit(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+def _load_cache(name: str) -> Dict[str, Any]:
+    try:
+        data = orjson.loads((CACHE_DIR / name).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _save_cache(name: str, data: Dict[str, Any]) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / name).write_bytes(orjson.dumps(data))
+    except OSError as e:
+        print(f"Could not write cache {name}: {e}", file=sys.stderr)
+
+def cached_product_url(source: str, company: str) -> Optional[str]:
+    """Return the product URL previously resolved for company, if still fresh."""
+    entry = _load_cache("resolve.json").get(f"{source}:{company.lower()}")
+    try:
+        if time.time() - entry["ts"] < RESOLVE_CACHE_TTL and isinstance(entry["url"], str):
+            return entry["url"]
+    except (KeyError, TypeError):
+        pass  # missing or malformed entry: resolve again
+    return None
+
+def store_product_url(source: str, company: str, url: str) -> None:
+    cache = _load_cache("resolve.json")
+    cache[f"{source}:{company.lower()}"] = {"url": url, "ts": time.time()}
+    _save_cache("resolve.json", cache)
+
+def _cached_page(entry: Any) -> Optional[Dict[str, Any]]:
+    """Rebuild a cached page entry, or None if it is malformed."""
+    try:
+        if not isinstance(entry["hash"], str):
+            return None
+        return {**entry, "reviews": [Review(**r) for r in entry["reviews"]]}
+    except (KeyError, TypeError):
+        return None
+
+def load_pages(key: str) -> Dict[str, Dict[str, Any]]:
+    """Return the cached pages stored under key, skipping expired or malformed data."""
+    run = _load_cache("pages.json").get(key)
+    try:
+        if time.time() - run["ts"] >= PAGE_CACHE_TTL:
+            return {}
+        entries = run["pages"].items()
+    except (KeyError, TypeError, AttributeError):
+        return {}
+    pages = {}
+    for url, entry in entries:
+        page = _cached_page(entry)
+        if page is not None:
+            pages[url] = page
+    return pages
+
+def store_pages(key: str, pages: Dict[str, Dict[str, Any]]) -> None:
+    now = time.time()
+    cache = _load_cache("pages.json")
+    cache[key] = {"ts": now, "pages": pages}
+    # drop expired and malformed runs, then keep only the most recent ones
+    fresh = {k: v for k, v in cache.items()
+             if isinstance(v, dict) and isinstance(v.get("ts"), (int, float)) and now - v["ts"] < PAGE_CACHE_TTL}
+    newest = sorted(fresh, key=lambda k: fresh[k]["ts"], reverse=True)[:PAGE_CACHE_MAX_RUNS]
+    _save_cache("pages.json", {k: fresh[k] for k in newest})
+
+async def _load_robots(http: HttpContext, origin: str) -> RobotFileParser:
+    """
+    Fetch and parse an origin's robots.txt, retrying like any other request.
+    As in RobotFileParser.read, 401/403 disallow everything and other 4xx
+    allow everything. A robots.txt that stays unreachable, rate-limited (429)
+    or failing (5xx) also disallows everything (RFC 9309).
+    """
+    rp = RobotFileParser(origin + "/robots.txt")
+    try:
+        resp = await _get(http, rp.url)
+    except httpx.HTTPError:
+        resp = None
+    status = resp[0] if resp else None
+    if status is None or status in (401, 403, 429) or status >= 500:
+        rp.disallow_all = True
+    elif status >= 400:
+        rp.allow_all = True
+    else:
+        rp.parse(resp[1].decode("utf-8", errors="replace").splitlines())
+    return rp
+
+async def can_fetch(http: HttpContext, url: str, user_agent: str) -> bool:
+    """Check url for user_agent against its host's robots.txt, fetched once per host per run."""
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    if origin not in http.robots:
+        http.robots[origin] = asyncio.ensure_future(_load_robots(http, origin))
+    rp = await http.robots[origin]
+    return rp.can_fetch(user_agent, url)
+
+def _date_format_for(s: str) -> Optional[str]:
+    """Pick the single strptime format that can match a non-ISO date string."""
+    if _DMY_DATE_RE.match(s):
+        return "%d-%m-%Y"
+    if s[:1].isdigit():
+        return "%d %B %Y"
+    month = s.split(" ", 1)[0]
+    return "%b %d, %Y" if len(month) <= 3 else "%B %d, %Y"
+
+@lru_cache(maxsize=4096)
 def parse_date_try(dt_str: str) -> Optional[datetime]:
-    for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%d %B %Y", "%B %d, %Y", "%b %d, %Y"):
+    s = dt_str.strip()
+    if not s:
+        return None
+    # fast paths: dispatch on the shape of the string instead of trying every format
+    if _ISO_DATE_RE.match(s):
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            pass
+    else:
+        try:
+            return datetime.strptime(s, _date_format_for(s))
+        except ValueError:
+            pass
+    for fmt in DATE_FORMATS:
         try:
-            return datetime.strptime(dt_str.strip(), fmt)
+            return datetime.strptime(s, fmt)
         except Exception:
             pass
     # fallback
@@ -44,242 +302,494 @@ def within_range(date_obj: datetime, start: Optional[datetime], end: Optional[da
         return False
     return True
 
-def scrape_g2(company: str, start: Optional[datetime], end: Optional[datetime]) -> List[Dict[str,Any]]:
+async def _request(http: HttpContext, url: str,
+                   headers: Optional[Dict[str, str]] = None) -> Optional[Tuple[int, bytes, Any]]:
     """
-    Very basic G2 scraper:
-    - Accepts either a product page URL (if 'company' contains 'http') or a company/product name.
-    - If given a name, attempts to use G2 search page to find a first matching product.
+    GET a URL and return (status, body, response headers), or None when
+    robots.txt disallows it.
     """
-    reviews = []
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    # one agent per request, so robots.txt is checked for the agent actually sent
+    user_agent = random.choice(UA_POOL)
+    if not await can_fetch(http, url, user_agent):
+        print("Skipping (disallowed by robots.txt)", url, file=sys.stderr)
+        return None
+    return await _get(http, url, {**(headers or {}), "User-Agent": user_agent})
 
-    # If company looks like a URL, use it directly
-    if company.startswith("http"):
-        product_url = company.rstrip("/")
+async def _get(http: HttpContext, url: str,
+               headers: Optional[Dict[str, str]] = None) -> Optional[Tuple[int, bytes, Any]]:
+    """
+    GET a URL without checking robots.txt. Connection errors and timeouts are
+    retried with exponential backoff, and 429/503 responses after their
+    Retry-After.
+    """
+    host = _host(url)
+    for attempt in range(MAX_RETRIES + 1):
+        backoff = RETRY_BACKOFF * (2 ** attempt)
+        try:
+            async with http.limiter.acquire(host):
+                r = await http.session.get(url, headers=headers)
+        except httpx.TransportError:
+            if attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(backoff)
+            continue
+        if r.status_code in (429, 503) and attempt < MAX_RETRIES:
+            wait = _retry_after(r.headers.get("Retry-After"), backoff)
+            if wait <= MAX_RETRY_AFTER:
+                print(f"Got {r.status_code}, retrying in {wait:.1f}s", url, file=sys.stderr)
+                # pause the whole host, not just this request; acquire() waits it out
+                http.limiter.defer(host, wait)
+                continue
+        return r.status_code, r.content, r.headers
+    return None
+
+def _retry_after(value: Optional[str], default: float) -> float:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return default
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        # a "-0000" zone parses as naive; HTTP dates are always UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+async def _fetch(http: HttpContext, url: str) -> Optional[bytes]:
+    """GET a URL and return the raw body, or None if it was not a 200 response."""
+    resp = await _request(http, url)
+    if resp is None or resp[0] != 200:
+        return None
+    return resp[1]
+
+async def _fetch_page(http: HttpContext, url: str, cached: Optional[Dict[str, Any]],
+                      parse_page: Callable[[bytes], Tuple[List[Review], bool]]) -> Optional[Dict[str, Any]]:
+    """
+    Fetch and parse one review page, revalidating against the copy cached by
+    a previous run. Returns the page's cache entry, or None if it failed to load.
+    A 304 response or an unchanged body reuses the cached reviews without parsing.
+    """
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    resp = await _request(http, url, headers)
+    if resp is None:
+        return None
+    status, content, resp_headers = resp
+    if status == 304 and cached:
+        return cached
+    if status != 200:
+        return None
+    digest = hashlib.sha1(content).hexdigest()
+    if cached and cached["hash"] == digest:
+        reviews, more = cached["reviews"], cached.get("more", True)
     else:
-        # Use G2 search to find product slug (best-effort)
-        q = company.replace(" ", "+")
-        search_url = f"https://www.g2.com/search?q={q}"
-        r = session.get(search_url, timeout=20)
-        soup = BeautifulSoup(r.text, "html.parser")
-        # find first product link
-        link = soup.find("a", {"data-qa": "product-card-link"})
-        if link and link.get("href"):
-            product_url = "https://www.g2.com" + link.get("href")
-        else:
-            # fallback: construct simple slug (may fail)
-            slug = company.lower().replace(" ", "-")
-            product_url = f"https://www.g2.com/products/{slug}/reviews"
+        # parse off the event loop so other pages keep downloading meanwhile
+        loop = asyncio.get_running_loop()
+        reviews, more = await loop.run_in_executor(PARSE_POOL, parse_page, content)
+    return {
+        "etag": resp_headers.get("ETag"),
+        "last_modified": resp_headers.get("Last-Modified"),
+        "hash": digest,
+        "reviews": reviews,
+        "more": more,
+    }
 
-    # iterate pages
+def new_session() -> httpx.AsyncClient:
+    """
+    Create the HTTP client shared by all scrapers. Connections are pooled and,
+    where the server supports HTTP/2, concurrent page requests share one.
+    """
+    limits = httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=KEEPALIVE_CONNECTIONS)
+    return httpx.AsyncClient(http2=True, headers=HEADERS, limits=limits,
+                             timeout=REQUEST_TIMEOUT, follow_redirects=True)
+
+async def _paginate(http: HttpContext, page_url: Callable[[int], str],
+                    parse_page: Callable[[bytes], Tuple[List[Review], bool]],
+                    page_cache: Dict[str, Dict[str, Any]]) -> List[Review]:
+    """
+    Fetch review pages PAGE_BATCH at a time and parse them in page order.
+    Stops at the first page that fails to load, has no review cards, or
+    reaches past the start of the date window. A page whose cards were all
+    filtered out (e.g. newer than --end) does not stop pagination.
+    page_cache maps page URLs to their cache entries and is updated in place.
+    """
+    reviews = []
     page = 1
     while True:
-        page_url = product_url + (f"?page={page}" if "?" not in product_url else f"&page={page}")
-        print("Fetching", page_url, file=sys.stderr)
-        r = session.get(page_url, timeout=20)
-        if r.status_code != 200:
-            break
-        soup = BeautifulSoup(r.text, "html.parser")
-        items = soup.select("div[itemprop='review']")
-        if not items:
-            # try alternate selector used by G2 front-end cards
-            items = soup.select("div.g2-review, div.review-card, div[class*='review']")
-        if not items:
+        urls = [page_url(p) for p in range(page, page + PAGE_BATCH)]
+        for url in urls:
+            print("Fetching", url, file=sys.stderr)
+        entries = await asyncio.gather(*[_fetch_page(http, url, page_cache.get(url), parse_page) for url in urls])
+        for url, entry in zip(urls, entries):
+            if entry is None:
+                return reviews
+            page_cache[url] = entry
+            reviews.extend(entry["reviews"])
+            if not entry.get("more", True):
+                return reviews
+        page += PAGE_BATCH
+
+# A find() query on a review card: (tag name or names, attrs).
+Query = Tuple[Any, Dict[str, Any]]
+
+# Queries shared between sites, built once at import rather than per review.
+TITLE_TAGS = ("h2", "h3", "h4")
+SUBTITLE_TAGS = ("h3", "h4")
+NO_ATTRS: Dict[str, Any] = {}
+PARAGRAPH = ("p", NO_ATTRS)
+TIME = ("time", NO_ATTRS)
+STRONG = ("strong", NO_ATTRS)
+RATING_CLASS = (None, {"class": "rating"})
+
+@dataclass(frozen=True)
+class SiteConfig:
+    """
+    Everything that differs between review sites. Lookups that take a
+    tuple of queries use the first one that matches.
+    """
+    name: str
+    base: str
+    search_url: Callable[[str], str]  # company -> search page URL
+    product_link: Dict[str, Any]  # attrs of the first product link on the search page
+    fallback_url: Callable[[str], str]  # slug -> product URL when search finds nothing
+    page_url: Callable[[str, int], str]  # (product URL, page) -> review page URL
+    reviews: Tuple[Tuple[SoupStrainer, Query], ...]  # review-card markup, primary first
+    title: Tuple[Query, ...]
+    body: Tuple[Query, ...]
+    date: Tuple[Query, ...]
+    rating: Tuple[Query, ...]
+    reviewer: Tuple[Query, ...]
+    fast: Optional["FastPatterns"] = None  # raw-HTML extraction used with --fast
+
+@dataclass(frozen=True)
+class FastPatterns:
+    """
+    Regexes that pull review fields straight out of page bytes, without
+    building a DOM. Each card runs from the tag carrying the card marker to
+    its matching close tag (card_tags matches that tag's opening and closing
+    forms). Like SiteConfig's queries, each field tries its patterns in order
+    within one card and takes the "text" group of the first match; date
+    patterns also capture the tag's "attrs" so a datetime attribute wins.
+    Attribute values may be quoted with either ' or ", as in HTML.
+    """
+    card: Pattern[bytes]
+    card_tags: Pattern[bytes]
+    title: Tuple[Pattern[bytes], ...]
+    body: Tuple[Pattern[bytes], ...]
+    date: Tuple[Pattern[bytes], ...]
+    rating: Tuple[Pattern[bytes], ...]
+    reviewer: Tuple[Pattern[bytes], ...]
+
+_TAG_RE = re.compile(rb"<[^>]*>")
+# a datetime attribute without a quoted value matches with value=None
+_DATETIME_ATTR_RE = re.compile(rb"""(?<![\w-])datetime\s*=\s*(?:(?P<q>["'])(?P<value>.*?)(?P=q))?""", re.DOTALL)
+
+def _query_page_url(product_url: str, page: int) -> str:
+    return product_url + (f"?page={page}" if "?" not in product_url else f"&page={page}")
+
+def _reviews_page_url(product_url: str, page: int) -> str:
+    return product_url + (f"/reviews?page={page}" if "/reviews" not in product_url else f"?page={page}")
+
+G2 = SiteConfig(
+    name="g2",
+    base="https://www.g2.com",
+    search_url=lambda q: f"https://www.g2.com/search?q={q}",
+    product_link={"data-qa": "product-card-link"},
+    fallback_url=lambda slug: f"https://www.g2.com/products/{slug}/reviews",
+    page_url=_query_page_url,
+    reviews=(
+        (G2_REVIEW_STRAINER, ("div", {"itemprop": "review"})),
+        # alternate markup used by G2 front-end cards
+        (G2_FALLBACK_STRAINER, ("div", {"class": G2_FALLBACK_CLASS_RE})),
+    ),
+    title=((TITLE_TAGS, NO_ATTRS),),
+    body=(PARAGRAPH,),
+    date=(TIME, ("span", {"class": "date"})),
+    rating=((None, {"data-qa": "rating"}),),
+    reviewer=((None, {"data-qa": "reviewer-name"}), STRONG),
+    # G2's schema.org review microdata is regular enough to read without a DOM
+    fast=FastPatterns(
+        card=re.compile(rb"""\bitemprop\s*=\s*(?P<q>["'])review(?P=q)"""),
+        card_tags=re.compile(rb"<(/?)div\b", re.IGNORECASE),
+        # mirrors the G2 queries above: time, then span.date; data-qa reviewer, then strong
+        title=(re.compile(rb"<(?P<tag>h[234])\b[^>]*>(?P<text>.*?)</(?P=tag)>", re.DOTALL),),
+        body=(re.compile(rb"<p\b[^>]*>(?P<text>.*?)</p>", re.DOTALL),),
+        date=(
+            re.compile(rb"<time\b(?P<attrs>[^>]*)>(?P<text>.*?)</time>", re.DOTALL),
+            re.compile(rb"""<span\b(?P<attrs>[^>]*\bclass\s*=\s*(?P<q>["'])(?:[^"']*\s)?date(?:\s[^"']*)?(?P=q)[^>]*)>"""
+                       rb"(?P<text>.*?)</span>", re.DOTALL),
+        ),
+        rating=(re.compile(rb"""<(?P<tag>\w+)\b[^>]*\bdata-qa\s*=\s*(?P<q>["'])rating(?P=q)[^>]*>(?P<text>.*?)</(?P=tag)>""",
+                           re.DOTALL),),
+        reviewer=(
+            re.compile(rb"""<(?P<tag>\w+)\b[^>]*\bdata-qa\s*=\s*(?P<q>["'])reviewer-name(?P=q)[^>]*>"""
+                       rb"(?P<text>.*?)</(?P=tag)>", re.DOTALL),
+            re.compile(rb"<strong\b[^>]*>(?P<text>.*?)</strong>", re.DOTALL),
+        ),
+    ),
+)
+
+CAPTERRA = SiteConfig(
+    name="capterra",
+    base="https://www.capterra.com",
+    search_url=lambda q: f"https://www.capterra.com/search?q={q}",
+    product_link={"data-qa": "product-name"},
+    fallback_url=lambda slug: f"https://www.capterra.com/p/{slug}/#reviews",
+    page_url=_query_page_url,
+    reviews=(
+        (CAPTERRA_REVIEW_STRAINER, ("div", {"class": "c-review"})),
+        (CAPTERRA_FALLBACK_STRAINER, (["div","li"], {"class": "review"})),
+    ),
+    title=((SUBTITLE_TAGS, NO_ATTRS),),
+    body=(PARAGRAPH,),
+    date=(TIME, ("span", NO_ATTRS)),
+    rating=(RATING_CLASS,),
+    reviewer=((None, {"class": "reviewer-name"}), STRONG),
+)
+
+TRUSTRADIUS = SiteConfig(
+    name="trustradius",
+    base="https://www.trustradius.com",
+    search_url=lambda q: f"https://www.trustradius.com/search?query={q}",
+    product_link={"class": "search-result-link"},
+    fallback_url=lambda slug: f"https://www.trustradius.com/products/{slug}/reviews",
+    page_url=_reviews_page_url,
+    reviews=(
+        (TRUSTRADIUS_REVIEW_STRAINER, (["div","article"], {"class": ["review-card","review"]})),
+    ),
+    title=((SUBTITLE_TAGS, NO_ATTRS),),
+    body=(("div", {"class": "review-body"}), PARAGRAPH),
+    date=(TIME,),
+    rating=(RATING_CLASS,),
+    reviewer=((None, {"class": "user-name"}), STRONG),
+)
+
+SITES = {site.name: site for site in (G2, CAPTERRA, TRUSTRADIUS)}
+
+def _find_first(tag: Tag, queries: Tuple[Query, ...]) -> Optional[Tag]:
+    for name, attrs in queries:
+        found = tag.find(name, attrs=attrs)
+        if found:
+            return found
+    return None
+
+def _parse_page(site: SiteConfig, content: bytes, start: Optional[datetime],
+                end: Optional[datetime]) -> Tuple[List[Review], bool]:
+    """
+    Extract the in-range reviews from a page, and whether later pages may
+    hold more: False when the page has no review cards or already reaches
+    past the start of the date window.
+    """
+    reviews = []
+    items = []
+    for strainer, (name, attrs) in site.reviews:
+        soup = BeautifulSoup(content, PARSER, parse_only=strainer)
+        items = soup.find_all(name, attrs=attrs)
+        if items:
             break
-        added = 0
-        for it in items:
-            # Extract title, body, date, rating
-            title = it.find(lambda tag: tag.name in ["h3","h4","h2"])
-            title_text = title.get_text(strip=True) if title else ""
-            body_tag = it.find("p")
-            body_text = body_tag.get_text(" ", strip=True) if body_tag else ""
-            date_tag = it.find(lambda tag: tag.name == "time" or (tag.name=="span" and "date" in (tag.get("class") or [])))
-            date_text = date_tag.get("datetime") if date_tag and date_tag.get("datetime") else (date_tag.get_text(strip=True) if date_tag else "")
-            date_obj = parse_date_try(date_text) if date_text else None
-            if date_obj and not within_range(date_obj, start, end):
+    title_q, body_q, date_q, rating_q, reviewer_q, source = (
+        site.title, site.body, site.date, site.rating, site.reviewer, site.name)
+    last_date = None
+    for it in items:
+        # Date first, so out-of-range reviews are skipped before the other lookups
+        date_tag = _find_first(it, date_q)
+        date_text = (date_tag.get("datetime") or date_tag.get_text(strip=True)) if date_tag else ""
+        date_obj = parse_date_try(date_text) if date_text else None
+        if date_obj:
+            last_date = date_obj
+            if (start or end) and not within_range(date_obj, start, end):
                 continue
-            rating_tag = it.find(attrs={"data-qa":"rating"})
-            rating = rating_tag.get_text(strip=True) if rating_tag else ""
-            reviewer = it.find(attrs={"data-qa":"reviewer-name"}) or it.find("strong")
-            reviewer_text = reviewer.get_text(strip=True) if reviewer else ""
-            review = {
-                "title": title_text,
-                "review": body_text,
-                "date": date_obj.isoformat() if date_obj else date_text,
-                "rating": rating,
-                "reviewer": reviewer_text,
-                "source": "g2",
-            }
-            reviews.append(review)
-            added += 1
-        if added == 0:
-            break
-        page += 1
-        time.sleep(1.0)
-    return reviews
+        # Extract title, body, rating, reviewer
+        title = _find_first(it, title_q)
+        title_text = title.get_text(strip=True) if title else ""
+        body = _find_first(it, body_q)
+        body_text = body.get_text(" ", strip=True) if body else ""
+        rating = _find_first(it, rating_q)
+        rating_text = rating.get_text(strip=True) if rating else ""
+        reviewer = _find_first(it, reviewer_q)
+        reviewer_text = reviewer.get_text(strip=True) if reviewer else ""
+        reviews.append(Review(
+            title_text,
+            body_text,
+            date_obj.isoformat() if date_obj else date_text,
+            rating_text,
+            reviewer_text,
+            source,
+        ))
+    # Reviews are listed newest first, so once the page reaches past the start
+    # of the window later pages can only hold older reviews.
+    more = bool(items) and not (start and last_date and last_date < start)
+    return reviews, more
+
+def _fast_match(patterns: Tuple[Pattern[bytes], ...], card: bytes) -> Optional[Match[bytes]]:
+    for pattern in patterns:
+        m = pattern.search(card)
+        if m:
+            return m
+    return None
+
+def _fast_text(raw: bytes, sep: str = "") -> str:
+    """Text of an HTML fragment, joined like bs4's get_text(sep, strip=True)."""
+    pieces = (html.unescape(t.decode("utf-8", errors="replace")).strip() for t in _TAG_RE.split(raw))
+    return sep.join(p for p in pieces if p)
+
+def _fast_field(patterns: Tuple[Pattern[bytes], ...], card: bytes, sep: str = "") -> str:
+    m = _fast_match(patterns, card)
+    return _fast_text(m.group("text"), sep) if m else ""
 
-def scrape_capterra(company: str, start: Optional[datetime], end: Optional[datetime]) -> List[Dict[str,Any]]:
+def _fast_cards(fast: FastPatterns, content: bytes) -> Optional[List[bytes]]:
     """
-    Simple Capterra scraper. Accepts company name OR a direct Capterra product URL.
+    Slice each review card out of the page, from its opening tag to the
+    matching close tag, so field patterns never run into the next card or
+    the page footer. Returns None if a card's markup does not balance.
     """
-    reviews = []
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    if company.startswith("http"):
-        product_url = company.rstrip("/")
-    else:
-        q = company.replace(" ", "+")
-        search_url = f"https://www.capterra.com/search?q={q}"
-        r = session.get(search_url, timeout=20)
-        soup = BeautifulSoup(r.text, "html.parser")
-        link = soup.find("a", {"data-qa": "product-name"})
-        if link and link.get("href"):
-            product_url = "https://www.capterra.com" + link.get("href")
+    cards = []
+    pos = 0
+    while True:
+        marker = fast.card.search(content, pos)
+        if not marker:
+            return cards
+        start = content.rfind(b"<", 0, marker.start())
+        if start < 0 or not fast.card_tags.match(content, start):
+            return None
+        depth = 0
+        for m in fast.card_tags.finditer(content, start):
+            depth += -1 if m.group(1) else 1
+            if depth == 0:
+                break
         else:
-            # naive fallback
-            slug = company.lower().replace(" ", "-")
-            product_url = f"https://www.capterra.com/p/{slug}/#reviews"
+            return None
+        end = content.find(b">", m.end()) + 1 or len(content)
+        cards.append(content[start:end])
+        pos = end
 
-    page = 1
-    while True:
-        page_url = product_url + (f"?page={page}" if "?" not in product_url else f"&page={page}")
-        print("Fetching", page_url, file=sys.stderr)
-        r = session.get(page_url, timeout=20)
-        if r.status_code != 200:
-            break
-        soup = BeautifulSoup(r.text, "html.parser")
-        items = soup.select("div.c-review")
-        if not items:
-            items = soup.select("div.review, li.review")
-        if not items:
-            break
-        added = 0
-        for it in items:
-            title = it.find(["h3","h4"])
-            title_text = title.get_text(strip=True) if title else ""
-            body = it.find("p")
-            body_text = body.get_text(" ", strip=True) if body else ""
-            date_tag = it.find(lambda tag: tag.name=="time" or tag.name=="span")
-            date_text = date_tag.get("datetime") if date_tag and date_tag.get("datetime") else (date_tag.get_text(strip=True) if date_tag else "")
-            date_obj = parse_date_try(date_text) if date_text else None
-            if date_obj and not within_range(date_obj, start, end):
+def _parse_page_fast(site: SiteConfig, content: bytes, start: Optional[datetime],
+                     end: Optional[datetime]) -> Optional[Tuple[List[Review], bool]]:
+    """
+    Regex counterpart of _parse_page for sites with FastPatterns. Returns
+    None when no review card is found, or a card lacks a date, title or body,
+    so the caller can fall back to the DOM.
+    """
+    fast = site.fast
+    cards = _fast_cards(fast, content)
+    if not cards:
+        return None
+    reviews = []
+    last_date = None
+    for card in cards:
+        date_m = _fast_match(fast.date, card)
+        title_m = _fast_match(fast.title, card)
+        body_m = _fast_match(fast.body, card)
+        if not (date_m and title_m and body_m):
+            # card doesn't have the expected shape; let the DOM parser handle the page
+            return None
+        datetime_attr = _DATETIME_ATTR_RE.search(date_m.group("attrs"))
+        if datetime_attr and datetime_attr.group("value") is None:
+            # a datetime we can't read would silently fall back to the text; let the DOM decide
+            return None
+        date_text = (datetime_attr and html.unescape(datetime_attr.group("value").decode("utf-8", errors="replace"))
+                     or _fast_text(date_m.group("text")))
+        date_obj = parse_date_try(date_text) if date_text else None
+        if date_obj:
+            last_date = date_obj
+            if (start or end) and not within_range(date_obj, start, end):
                 continue
-            rating = it.find(attrs={"class":"rating"})
-            rating_text = rating.get_text(strip=True) if rating else ""
-            reviewer = it.find(attrs={"class":"reviewer-name"}) or it.find("strong")
-            reviewer_text = reviewer.get_text(strip=True) if reviewer else ""
-            review = {
-                "title": title_text,
-                "review": body_text,
-                "date": date_obj.isoformat() if date_obj else date_text,
-                "rating": rating_text,
-                "reviewer": reviewer_text,
-                "source": "capterra",
-            }
-            reviews.append(review)
-            added += 1
-        if added == 0:
-            break
-        page += 1
-        time.sleep(1.0)
-    return reviews
+        reviews.append(Review(
+            _fast_text(title_m.group("text")),
+            _fast_text(body_m.group("text"), " "),
+            date_obj.isoformat() if date_obj else date_text,
+            _fast_field(fast.rating, card),
+            _fast_field(fast.reviewer, card),
+            site.name,
+        ))
+    more = not (start and last_date and last_date < start)
+    return reviews, more
 
-def scrape_trustradius(company: str, start: Optional[datetime], end: Optional[datetime]) -> List[Dict[str,Any]]:
+async def scrape_site(http: HttpContext, site: SiteConfig, company: str,
+                      start: Optional[datetime], end: Optional[datetime], fast: bool = False) -> List[Review]:
     """
-    Basic TrustRadius scraper (bonus source).
+    Scrape one review site:
+    - Accepts either a product page URL (if 'company' contains 'http') or a company/product name.
+    - If given a name, attempts to use the site's search page to find a first matching product.
+    - With fast=True, sites that define FastPatterns are read with regexes,
+      falling back to the DOM on pages the regexes can't fully read.
     """
-    reviews = []
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    # If company looks like a URL, use it directly
     if company.startswith("http"):
         product_url = company.rstrip("/")
     else:
+        product_url = cached_product_url(site.name, company)
+    if product_url is None:
+        # Use site search to find product slug (best-effort)
         q = company.replace(" ", "+")
-        search_url = f"https://www.trustradius.com/search?query={q}"
-        r = session.get(search_url, timeout=20)
-        soup = BeautifulSoup(r.text, "html.parser")
-        link = soup.find("a", {"class":"search-result-link"})
+        content = await _fetch(http, site.search_url(q))
+        soup = BeautifulSoup(content or b"", PARSER)
+        # find first product link
+        link = soup.find("a", site.product_link)
         if link and link.get("href"):
-            product_url = "https://www.trustradius.com" + link.get("href")
+            product_url = site.base + link.get("href")
+            store_product_url(site.name, company, product_url)
         else:
+            # fallback: construct simple slug (may fail)
             slug = company.lower().replace(" ", "-")
-            product_url = f"https://www.trustradius.com/products/{slug}/reviews"
+            product_url = site.fallback_url(slug)
 
-    page = 1
-    while True:
-        page_url = product_url + (f"/reviews?page={page}" if "/reviews" not in product_url else f"?page={page}")
-        print("Fetching", page_url, file=sys.stderr)
-        r = session.get(page_url, timeout=20)
-        if r.status_code != 200:
-            break
-        soup = BeautifulSoup(r.text, "html.parser")
-        items = soup.select("div.review-card, article.review")
-        if not items:
-            break
-        added = 0
-        for it in items:
-            title = it.find(["h3","h4"])
-            title_text = title.get_text(strip=True) if title else ""
-            body = it.find("div", {"class":"review-body"}) or it.find("p")
-            body_text = body.get_text(" ", strip=True) if body else ""
-            date_tag = it.find("time")
-            date_text = date_tag.get("datetime") if date_tag and date_tag.get("datetime") else (date_tag.get_text(strip=True) if date_tag else "")
-            date_obj = parse_date_try(date_text) if date_text else None
-            if date_obj and not within_range(date_obj, start, end):
-                continue
-            rating = it.find(attrs={"class":"rating"})
-            rating_text = rating.get_text(strip=True) if rating else ""
-            reviewer = it.find(attrs={"class":"user-name"}) or it.find("strong")
-            reviewer_text = reviewer.get_text(strip=True) if reviewer else ""
-            review = {
-                "title": title_text,
-                "review": body_text,
-                "date": date_obj.isoformat() if date_obj else date_text,
-                "rating": rating_text,
-                "reviewer": reviewer_text,
-                "source": "trustradius",
-            }
-            reviews.append(review)
-            added += 1
-        if added == 0:
-            break
-        page += 1
-        time.sleep(1.0)
+    # cached pages are only valid for the same date window and extractor, as both are applied while parsing
+    mode = "fast" if fast and site.fast else "dom"
+    cache_key = f"{site.name}:{company.lower()}:{start}:{end}:{mode}"
+    page_cache = load_pages(cache_key)
+    def parse(content: bytes) -> Tuple[List[Review], bool]:
+        if mode == "fast":
+            parsed = _parse_page_fast(site, content, start, end)
+            if parsed is not None:
+                return parsed
+        return _parse_page(site, content, start, end)
+
+    reviews = await _paginate(http, lambda page: site.page_url(product_url, page), parse, page_cache)
+    store_pages(cache_key, page_cache)
     return reviews
 
+async def scrape_sources(company: str, sources: List[str], start: Optional[datetime], end: Optional[datetime],
+                         fast: bool = False) -> List[Any]:
+    """Run the selected scrapers concurrently; failed sources yield their exception."""
+    async with new_session() as session:
+        http = HttpContext(session, AsyncRateLimiter(HOST_DELAY, DEFAULT_HOST_DELAY, DELAY_JITTER))
+        return await asyncio.gather(*[scrape_site(http, SITES[s], company, start, end, fast) for s in sources],
+                                    return_exceptions=True)
+
 def main():
     parser = argparse.ArgumentParser(description="Scrape SaaS reviews from G2, Capterra, TrustRadius")
     parser.add_argument("--company", required=True, help="Company name or product URL")
     parser.add_argument("--start", required=False, help="Start date (YYYY-MM-DD)")
     parser.add_argument("--end", required=False, help="End date (YYYY-MM-DD)")
-    parser.add_argument("--source", required=False, choices=["g2","capterra","trustradius","all"], default="all")
+    parser.add_argument("--source", required=False, choices=[*SITES, "all"], default="all")
     parser.add_argument("--output", required=False, default="reviews_output.json")
+    parser.add_argument("--fast", action="store_true",
+                        help="Extract G2 reviews with regexes on the raw HTML instead of building a DOM")
     args = parser.parse_args()
 
     start = parse_date_try(args.start) if args.start else None
     end = parse_date_try(args.end) if args.end else None
 
     all_reviews = []
-    sources = ["g2","capterra","trustradius"] if args.source=="all" else [args.source]
-    for s in sources:
-        try:
-            if s=="g2":
-                res = scrape_g2(args.company, start, end)
-            elif s=="capterra":
-                res = scrape_capterra(args.company, start, end)
-            elif s=="trustradius":
-                res = scrape_trustradius(args.company, start, end)
-            else:
-                res = []
-            print(f"Found {len(res)} reviews from {s}", file=sys.stderr)
-            all_reviews.extend(res)
-        except Exception as e:
-            print(f"Error scraping {s}: {e}", file=sys.stderr)
+    sources = list(SITES) if args.source=="all" else [args.source]
+    results = asyncio.run(scrape_sources(args.company, sources, start, end, args.fast))
+    for s, res in zip(sources, results):
+        if isinstance(res, BaseException):
+            print(f"Error scraping {s}: {res}", file=sys.stderr)
+            continue
+        print(f"Found {len(res)} reviews from {s}", file=sys.stderr)
+        all_reviews.extend(res)
 
     # Save output
-    with open(args.output, "w", encoding="utf-8") as fh:
-        json.dump(all_reviews, fh, indent=2, ensure_ascii=False)
+    with open(args.output, "wb") as fh:
+        fh.write(orjson.dumps(all_reviews, option=orjson.OPT_INDENT_2))
     print(f"Wrote {len(all_reviews)} reviews to {args.output}", file=sys.stderr)
 
 if __name__ == "__main__":